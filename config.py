@@ -33,6 +33,23 @@ RSI_CHILD_SUPPORT_HIGH = 40
 RSI_CHILD_RESISTANCE_LOW = 60
 RSI_CHILD_RESISTANCE_HIGH = 62
 
+# Indicator Cache (max cached indicator results, LRU evicted)
+INDICATOR_CACHE_SIZE = 256
+
+# Minutes before the NSE open to refresh the Angel session
+EQUITY_WARMUP_MINUTES = 10
+
+# Profiling (arm with PROFILE_CYCLES at startup, kill -USR1 <pid>, or GET /profile?cycles=N)
+PROFILE_CYCLES = int(os.getenv("PROFILE_CYCLES", "0"))
+PROFILE_SIGNAL_CYCLES = 3
+PROFILE_HTTP_PORT = os.getenv("PROFILE_HTTP_PORT") # Optional, disabled if unset
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+PROFILE_KEEP = 30 # Cycles kept on disk before rotation
+
+# Evaluation Journal (one gzip CSV per day, query with evaluation_journal.load_journal)
+JOURNAL_DIR = os.getenv("JOURNAL_DIR", "journal")
+JOURNAL_FLUSH_SECONDS = 10
+
 # Timeframe Sets
 STRATEGY_SETS = [
     {
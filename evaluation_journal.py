@@ -0,0 +1,116 @@
+import atexit
+import csv
+import gzip
+import os
+import signal
+import sys
+import threading
+from datetime import datetime, date
+import pandas as pd
+from logzero import logger
+
+# One row per (symbol, strategy set, cycle)
+COLUMNS = [
+    "time", "cycle", "symbol", "strategy", "stage",
+    "p1_rsi", "p2_rsi", "child_rsi", "mode", "parents_ok",
+    "child_ok", "warning", "exit", "signal", "price", "error"
+]
+
+class EvaluationJournal:
+    """
+    Structured audit trail of every strategy evaluation.
+    record() only appends a tuple to an in-memory buffer; a background thread
+    flushes batches to one gzip CSV per day (each batch is an appended gzip member).
+    """
+    def __init__(self, directory="journal", flush_interval=10, batch_size=500):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def record(self, **fields):
+        fields.setdefault("time", datetime.now().isoformat(timespec="seconds"))
+        row = tuple(fields.get(c) for c in COLUMNS)
+        with self._lock:
+            self._buffer.append(row)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="EvaluationJournal", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        logger.info(f"Evaluation Journal writing to {self.directory}/ every {self.flush_interval}s")
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+        if not rows:
+            return
+
+        # Group by day so a batch spanning midnight lands in the right files
+        by_day = {}
+        for row in rows:
+            by_day.setdefault(row[0][:10], []).append(row)
+
+        with self._write_lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                for day, day_rows in by_day.items():
+                    path = journal_path(day, self.directory)
+                    new_file = not os.path.exists(path)
+                    with gzip.open(path, 'at', newline='', compresslevel=6) as f:
+                        writer = csv.writer(f)
+                        if new_file:
+                            writer.writerow(COLUMNS)
+                        writer.writerows(day_rows)
+            except Exception as e:
+                logger.error(f"Journal Flush Failed ({len(rows)} records dropped): {e}")
+
+    def install_signal_handler(self):
+        """
+        Turns SIGTERM (Render restarts/redeploys) into SystemExit so the stack unwinds,
+        in-flight records are written to the buffer, and the atexit close() flushes it.
+        No locking or I/O happens in the handler itself, since the main thread may be
+        inside record() when the signal lands. Must be called from the main thread.
+        """
+        def handle_sigterm(signum, frame):
+            sys.exit(0)
+        signal.signal(signal.SIGTERM, handle_sigterm)
+
+    def close(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.flush()
+
+
+def journal_path(day, directory="journal"):
+    if isinstance(day, (date, datetime)):
+        day = day.strftime("%Y-%m-%d")
+    return os.path.join(directory, f"evaluations_{day}.csv.gz")
+
+
+def load_journal(day=None, directory="journal"):
+    """
+    Loads one day's evaluations into a DataFrame (today if day is None).
+    """
+    path = journal_path(day or date.today(), directory)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=COLUMNS)
+    return pd.read_csv(path, compression='gzip', parse_dates=['time'])
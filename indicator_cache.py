@@ -0,0 +1,86 @@
+import inspect
+import threading
+from collections import OrderedDict
+
+import pandas_ta as ta
+from logzero import logger
+
+class IndicatorCache:
+    """
+    Shared LRU cache for pandas_ta indicator results.
+    Key: (symbol, timeframe, indicator, params, first bar timestamp, row count, last bar OHLCV)
+    The full last bar is part of the key because the newest candle is still forming,
+    so its timestamp alone does not identify the data the indicator was computed on.
+    The first bar and row count pin the window, so a cached series always lines up
+    row for row with the frame it is assigned to.
+    """
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _bar_times(df):
+        # SmartApiHelper indexes by 'date', DeltaApiHelper keeps it as a column
+        if 'date' in df.columns:
+            return df['date'].iloc[0], df['date'].iloc[-1]
+        return df.index[0], df.index[-1]
+
+    def make_key(self, symbol, timeframe, indicator, df, **params):
+        first_ts, last_ts = self._bar_times(df)
+        last_bar = tuple(float(df[col].iloc[-1]) for col in ('open', 'high', 'low', 'close', 'volume') if col in df.columns)
+        return (symbol, timeframe, indicator, tuple(sorted(params.items())), first_ts, len(df), last_ts, last_bar)
+
+    def get(self, symbol, timeframe, indicator, df, **params):
+        """
+        Returns the indicator output for df, computing it with pandas_ta only on a miss.
+        Inputs (high/low/close/volume) are passed when the indicator accepts them.
+        """
+        if df is None or df.empty:
+            return None
+
+        key = self.make_key(symbol, timeframe, indicator, df, **params)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        result = self._compute(indicator, df, **params)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def _compute(self, indicator, df, **params):
+        func = getattr(ta, indicator, None)
+        if func is None:
+            raise ValueError(f"Unknown pandas_ta indicator: {indicator}")
+
+        arg_names = inspect.signature(func).parameters
+        inputs = {}
+        for col in ('open', 'high', 'low', 'close', 'volume'):
+            if col in arg_names and col in df.columns:
+                inputs[col] = df[col]
+        # Single-series indicators (rsi, ema, sma ...) take 'close' as their first argument
+        if not inputs:
+            inputs['close'] = df['close']
+        return func(**inputs, **params)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def log_stats(self):
+        s = self.stats()
+        logger.info(f"Indicator Cache: {s['size']} entries, {s['hits']} hits, {s['misses']} misses")
@@ -6,6 +6,9 @@ from datetime import datetime
 from notifier import TelegramNotifier
 from smart_api_helper import SmartApiHelper
 from strategy_rep import REPStrategy
+from indicator_cache import IndicatorCache
+from scan_profiler import ScanProfiler
+from evaluation_journal import EvaluationJournal
 
 def main():
     logger.info("Initializing REP Strategy Bot...")
@@ -18,8 +21,9 @@ def main():
         totp_key=config.TOTP_KEY
     )
 
-    # 2. Initialize Strategy
-    strategy = REPStrategy(rsi_period=config.RSI_PERIOD)
+    # 2. Initialize Strategy (indicators shared across strategy sets via LRU cache)
+    indicator_cache = IndicatorCache(max_entries=config.INDICATOR_CACHE_SIZE)
+    strategy = REPStrategy(rsi_period=config.RSI_PERIOD, indicator_cache=indicator_cache)
     
     # 3. Initialize Notifiers
     notifier_eq = TelegramNotifier(config.TELEGRAM_BOT_TOKEN_EQUITY, config.TELEGRAM_CHAT_ID_EQUITY)
@@ -35,18 +39,16 @@ def main():
     except Exception as e:
         logger.error(f"Startup Alert Failed: {e}")
 
-    def is_angel_market_open():
-        # IST Check for Angel One
-        from datetime import timedelta, timezone
-        utc_now = datetime.now(timezone.utc)
-        ist_now = utc_now + timedelta(hours=5, minutes=30)
-        current_time = ist_now.time()
-        start_time = datetime.strptime("09:15", "%H:%M").time()
-        end_time = datetime.strptime("15:30", "%H:%M").time()
-        
-        # Weekend Check
-        if ist_now.weekday() >= 5: return False
-        return start_time <= current_time <= end_time
+    # 5. Evaluation Journal (batched background writes)
+    journal = EvaluationJournal(directory=config.JOURNAL_DIR, flush_interval=config.JOURNAL_FLUSH_SECONDS)
+    journal.start()
+    journal.install_signal_handler()
+
+    # 6. Trading Calendars (NSE sessions/holidays, Delta 24/7)
+    from market_calendar import load_calendars
+    calendars = load_calendars()
+    nse_calendar = calendars["NSE"]
+    delta_calendar = calendars["DELTA"]
 
     # Lazy Load Tokens
     from token_loader import TokenLoader
@@ -66,44 +68,89 @@ def main():
             except Exception as e:
                 logger.error(f"Failed to load tokens: {e}")
 
-    bot_state = {"last_angel_status": None}
+    bot_state = {"last_angel_status": None, "warmed_session": None, "cycle": 0, "frames": {}}
+
+    def fetch_frame(helper_obj, identifier, exchange, timeframe):
+        """
+        Fetches candles once per (symbol, timeframe, cycle). Strategy sets that share a
+        timeframe (e.g. INTRADAY p1 / SWING p2) evaluate the same frame, so the
+        indicator cache key matches and RSI is computed once.
+        """
+        frames = bot_state["frames"]
+        key = (exchange, identifier, timeframe)
+        if key not in frames:
+            frames[key] = helper_obj.get_historical_data(identifier, exchange, timeframe)
+        return frames[key]
+
+    def warm_up_equity(next_open):
+        """
+        Pre-open warm-up: refresh the Angel session so the first scan after
+        the open does not run on an expired token or pay for the login.
+        """
+        logger.info(f"Pre-open warm-up for {next_open.strftime('%Y-%m-%d %H:%M')} session...")
+        load_tokens()
+        helper.login()
+        bot_state["warmed_session"] = next_open.date()
 
     def process_symbol(symbol, identifier, exchange, helper_obj, notifier_obj, timeframes):
         """
         Common logic to process a symbol for a specific timeframe set.
         """
         strat_name = timeframes['name']
+        # Journal record; 'stage' is the last step reached this cycle
+        rec = {"cycle": bot_state["cycle"], "symbol": symbol, "strategy": strat_name, "stage": "P1"}
         try:
             # Rate Limit Sleep
             time.sleep(0.5)
 
             # 1. Parent 1
-            p1 = helper_obj.get_historical_data(identifier, exchange, timeframes['p1'])
-            if p1 is None: return
-            p1 = strategy.calculate_rsi(p1)
-            if p1 is None: return
+            p1 = fetch_frame(helper_obj, identifier, exchange, timeframes['p1'])
+            if p1 is None:
+                rec["stage"] = "P1_NO_DATA"
+                return
+            p1 = strategy.calculate_rsi(p1, symbol, timeframes['p1'])
+            if p1 is None:
+                rec["stage"] = "P1_SHORT_DATA"
+                return
             p1_rsi = p1['rsi'].iloc[-1]
+            rec["p1_rsi"] = round(float(p1_rsi), 2)
 
             # Filter: Must be trending (>60 or <40)
             if not (p1_rsi >= config.RSI_PARENT_THRESHOLD or p1_rsi <= config.RSI_PARENT_SHORT_THRESHOLD):
+                rec["stage"] = "P1_NEUTRAL"
                 return
 
+            rec["stage"] = "P2"
+
             # 2. Parent 2
-            p2 = helper_obj.get_historical_data(identifier, exchange, timeframes['p2'])
-            if p2 is None: return
-            p2 = strategy.calculate_rsi(p2)
-            if p2 is None: return
+            p2 = fetch_frame(helper_obj, identifier, exchange, timeframes['p2'])
+            if p2 is None:
+                rec["stage"] = "P2_NO_DATA"
+                return
+            p2 = strategy.calculate_rsi(p2, symbol, timeframes['p2'])
+            if p2 is None:
+                rec["stage"] = "P2_SHORT_DATA"
+                return
             p2_rsi = p2['rsi'].iloc[-1]
+            rec["p2_rsi"] = round(float(p2_rsi), 2)
 
             # Consistency Check
+            rec["stage"] = "P2_MISMATCH"
             if p1_rsi >= config.RSI_PARENT_THRESHOLD and p2_rsi < config.RSI_PARENT_THRESHOLD: return
             if p1_rsi <= config.RSI_PARENT_SHORT_THRESHOLD and p2_rsi > config.RSI_PARENT_SHORT_THRESHOLD: return
 
             # 3. Child (Entry)
-            child = helper_obj.get_historical_data(identifier, exchange, timeframes['child'])
-            if child is None: return
-            child = strategy.calculate_rsi(child)
-            if child is None: return
+            rec["stage"] = "CHILD"
+            child = fetch_frame(helper_obj, identifier, exchange, timeframes['child'])
+            if child is None:
+                rec["stage"] = "CHILD_NO_DATA"
+                return
+            child = strategy.calculate_rsi(child, symbol, timeframes['child'])
+            if child is None:
+                rec["stage"] = "CHILD_SHORT_DATA"
+                return
+            rec["child_rsi"] = round(float(child['rsi'].iloc[-1]), 2)
+            rec["stage"] = "EVALUATED"
 
             # 4. Strategy Check
             parents_ok, parents_msg, mode = strategy.check_parent_conditions(
@@ -111,6 +158,8 @@ def main():
                 threshold_long=config.RSI_PARENT_THRESHOLD,
                 threshold_short=config.RSI_PARENT_SHORT_THRESHOLD
             )
+            rec["parents_ok"] = parents_ok
+            rec["mode"] = mode
 
             # --- Parent Trend Alert ---
             if parents_ok and mode:
@@ -134,6 +183,7 @@ def main():
 
             # Warnings & Exits
             warning_triggered, warning_msg = strategy.check_early_warning(child, p2)
+            rec["warning"] = warning_triggered
             if warning_triggered:
                 warn_key = f"{symbol}_{strat_name}_WARN"
                 last_warn = bot_state.get("alerts", {}).get(warn_key, 0)
@@ -143,6 +193,7 @@ def main():
                     bot_state["alerts"][warn_key] = time.time()
 
             exit_triggered, exit_msg = strategy.check_exit_condition(child, p2)
+            rec["exit"] = exit_triggered
             if exit_triggered:
                 exit_key = f"{symbol}_{strat_name}_EXIT"
                 last_exit = bot_state.get("alerts", {}).get(exit_key, 0)
@@ -161,10 +212,13 @@ def main():
                     resist_low=config.RSI_CHILD_RESISTANCE_LOW,
                     resist_high=config.RSI_CHILD_RESISTANCE_HIGH
                 )
+                rec["child_ok"] = child_ok
                 
                 if child_ok:
                     rsi_child_val = child['rsi'].iloc[-1]
                     trigger_price = confirmation_candle['close']
+                    rec["signal"] = mode
+                    rec["price"] = float(trigger_price)
                     msg = (f"🚀 **REP {mode} SIGNAL** ({strat_name})\n"
                            f"Symbol: {symbol}\n"
                            f"Price: {trigger_price}\n"
@@ -176,14 +230,19 @@ def main():
                     notifier_obj.send_alert(msg)
 
         except Exception as e:
+            rec["error"] = str(e)
             logger.error(f"Error processing {symbol} ({strat_name}): {e}")
+        finally:
+            journal.record(**rec)
 
 
     def run_scan():
+        bot_state["cycle"] += 1
+        bot_state["frames"] = {}
         load_tokens()
         
-        # --- 1. Process Angel One (Equity based on Market Hours) ---
-        angel_open = is_angel_market_open()
+        # --- 1. Process Angel One (Equity based on NSE Calendar) ---
+        angel_open = nse_calendar.is_open()
         
         # Alert Status Change - EQUITY
         if bot_state["last_angel_status"] is not None:
@@ -200,18 +259,36 @@ def main():
                 for strat_set in config.STRATEGY_SETS:
                     process_symbol(item['symbol'], item['token'], item['exchange'], helper, notifier_eq, strat_set)
         else:
-            logger.info("Equity Market Closed. Skipping Angel symbols.")
+            next_open = nse_calendar.next_open()
+            minutes_to_open = (next_open - datetime.now(nse_calendar.tz)).total_seconds() / 60
+            logger.info(f"Equity Market Closed. Skipping Angel symbols until {next_open.strftime('%Y-%m-%d %H:%M')}.")
+            if minutes_to_open <= config.EQUITY_WARMUP_MINUTES and bot_state["warmed_session"] != next_open.date():
+                try:
+                    warm_up_equity(next_open)
+                except Exception as e:
+                    logger.error(f"Warm-up Failed: {e}")
 
         # --- 2. Process Delta Exchange (Crypto 24/7) ---
-        if config.CRYPTO_SYMBOLS:
+        if config.CRYPTO_SYMBOLS and delta_calendar.is_open():
             logger.info(f"Scanning {len(config.CRYPTO_SYMBOLS)} Crypto Symbols...")
             for sym in config.CRYPTO_SYMBOLS:
                 # Iterate through all configured strategy sets
                 for strat_set in config.STRATEGY_SETS:
                     process_symbol(sym, sym, "DELTA", delta_helper, notifier_crypto, strat_set)
 
+        indicator_cache.log_stats()
+        bot_state["frames"] = {}
         logger.info("Scan Cycle Complete.")
 
+    # Profiling Hooks (zero-cost until armed)
+    profiler = ScanProfiler(output_dir=config.PROFILE_DIR, keep=config.PROFILE_KEEP)
+    profiler.install_signal_handler(cycles=config.PROFILE_SIGNAL_CYCLES)
+    if config.PROFILE_HTTP_PORT:
+        profiler.start_http_trigger(int(config.PROFILE_HTTP_PORT))
+    if config.PROFILE_CYCLES:
+        profiler.arm(config.PROFILE_CYCLES)
+    run_scan = profiler.wrap(run_scan)
+
     # Run Scan Logic in a separate thread so that we can keep the main thread for the scheduler
     import threading
     
@@ -0,0 +1,219 @@
+import json
+import os
+from datetime import datetime, date, time as dtime, timedelta, timezone
+from logzero import logger
+
+# Bot timeframe names -> bar length in minutes
+TIMEFRAME_MINUTES = {
+    "FIVE_MINUTE": 5,
+    "FIFTEEN_MINUTE": 15,
+    "ONE_HOUR": 60,
+    "ONE_DAY": 1440
+}
+
+class ExchangeCalendar:
+    """
+    Precomputed trading calendar for a session-based exchange (NSE).
+    Sessions are built once from a local JSON file (holidays + special sessions),
+    so is_open / next_open / next_close / bar_bounds are dict lookups.
+    Dates outside the file's years fall back to the plain weekday rule (holidays
+    unknown), with a warning at load and on the first such query.
+    """
+    def __init__(self, calendar_file="nse_calendar.json", lookahead_days=14):
+        with open(calendar_file, 'r') as f:
+            data = json.load(f)
+
+        self.name = data["exchange"]
+        self.tz = timezone(timedelta(minutes=data["utc_offset_minutes"]))
+        self.open_time = datetime.strptime(data["open"], "%H:%M").time()
+        self.close_time = datetime.strptime(data["close"], "%H:%M").time()
+        self.holidays = {date.fromisoformat(d): name for d, name in data.get("holidays", {}).items()}
+        self.special_sessions = {date.fromisoformat(d): s for d, s in data.get("special_sessions", {}).items()}
+
+        # Cover the years listed in the file; an empty file falls back to the current year
+        years = [d.year for d in list(self.holidays) + list(self.special_sessions)]
+        if not years:
+            years = [self._now().year]
+            logger.warning(f"{self.name} Calendar: no holidays or special sessions in {calendar_file}. "
+                           f"Using weekday-only sessions for {years[0]}.")
+        first_day = date(min(years), 1, 1)
+        last_day = date(max(years), 12, 31) + timedelta(days=lookahead_days)
+        self._build(first_day, last_day)
+        self._warned_out_of_range = False
+        logger.info(f"{self.name} Calendar: {len(self._sessions)} sessions precomputed ({first_day} to {last_day})")
+
+        required_day = date(self._now().year, 12, 31) + timedelta(days=lookahead_days)
+        if last_day < required_day:
+            logger.warning(f"{self.name} Calendar only covers up to {last_day} (need {required_day}). "
+                           f"Add next year's holidays to {calendar_file}.")
+
+    def _session_for(self, day):
+        """
+        Returns (open_dt, close_dt) for a day, or None if the exchange is shut.
+        """
+        if day in self.special_sessions:
+            s = self.special_sessions[day]
+            open_t = datetime.strptime(s["open"], "%H:%M").time()
+            close_t = datetime.strptime(s["close"], "%H:%M").time()
+        elif day.weekday() >= 5 or day in self.holidays:
+            return None
+        else:
+            open_t, close_t = self.open_time, self.close_time
+        return (datetime.combine(day, open_t, tzinfo=self.tz),
+                datetime.combine(day, close_t, tzinfo=self.tz))
+
+    def _build(self, first_day, last_day):
+        self._first_day = first_day
+        self._last_day = last_day
+        self._sessions = {}       # date -> (open_dt, close_dt)
+        self._session_list = []   # chronological sessions
+        self._next_index = {}     # date -> index of first session on or after that date
+
+        day = first_day
+        while day <= last_day:
+            session = self._session_for(day)
+            if session:
+                self._sessions[day] = session
+                self._session_list.append(session)
+            day += timedelta(days=1)
+
+        idx = len(self._session_list)
+        day = last_day
+        while day >= first_day:
+            if day in self._sessions:
+                idx -= 1
+            self._next_index[day] = idx
+            day -= timedelta(days=1)
+
+    def _now(self, now=None):
+        if now is None:
+            return datetime.now(self.tz)
+        if now.tzinfo is None:
+            return now.replace(tzinfo=self.tz)
+        return now.astimezone(self.tz)
+
+    def _in_range(self, day):
+        return self._first_day <= day <= self._last_day
+
+    def _warn_out_of_range(self, day):
+        if not self._warned_out_of_range:
+            self._warned_out_of_range = True
+            logger.warning(f"{self.name} Calendar has no holiday data for {day}; "
+                           f"using weekday-only sessions beyond {self._last_day}.")
+
+    def session(self, day):
+        if self._in_range(day):
+            return self._sessions.get(day)
+        self._warn_out_of_range(day)
+        return self._session_for(day)
+
+    def is_trading_day(self, day=None):
+        return self.session(day or self._now().date()) is not None
+
+    def is_open(self, now=None):
+        now = self._now(now)
+        session = self.session(now.date())
+        if session is None:
+            return False
+        return session[0] <= now <= session[1]
+
+    def _sessions_from(self, day):
+        """
+        Yields sessions starting at 'day'. Uses the precomputed index when in range.
+        """
+        if self._in_range(day):
+            idx = self._next_index[day]
+            while idx < len(self._session_list):
+                yield self._session_list[idx]
+                idx += 1
+            day = self._last_day + timedelta(days=1)
+        self._warn_out_of_range(day)
+        while True:
+            session = self._session_for(day)
+            if session:
+                yield session
+            day += timedelta(days=1)
+
+    def next_open(self, now=None):
+        """
+        Start of the next session strictly after 'now' (tomorrow's open while the market is open).
+        """
+        now = self._now(now)
+        for open_dt, _ in self._sessions_from(now.date()):
+            if open_dt > now:
+                return open_dt
+
+    def next_close(self, now=None):
+        """
+        End of the current session if open, else end of the next session.
+        """
+        now = self._now(now)
+        for _, close_dt in self._sessions_from(now.date()):
+            if close_dt >= now:
+                return close_dt
+
+    def bar_bounds(self, timeframe, now=None):
+        """
+        (start, end) of the bar containing 'now'. Bars are anchored at the session open
+        (09:15, 10:15 ... for ONE_HOUR) and the last bar is cut at the close.
+        Returns None outside a session.
+        """
+        now = self._now(now)
+        session = self.session(now.date())
+        if session is None or not (session[0] <= now <= session[1]):
+            return None
+        open_dt, close_dt = session
+        minutes = TIMEFRAME_MINUTES[timeframe]
+        if minutes >= 1440:
+            return open_dt, close_dt
+        elapsed = int((now - open_dt).total_seconds() // 60)
+        start = open_dt + timedelta(minutes=(elapsed // minutes) * minutes)
+        return start, min(start + timedelta(minutes=minutes), close_dt)
+
+
+class AlwaysOpenCalendar:
+    """
+    24/7 profile (Delta Exchange). Bars are anchored at UTC midnight.
+    """
+    def __init__(self, name="DELTA"):
+        self.name = name
+        self.tz = timezone.utc
+
+    def _now(self, now=None):
+        if now is None:
+            return datetime.now(self.tz)
+        if now.tzinfo is None:
+            return now.replace(tzinfo=self.tz)
+        return now.astimezone(self.tz)
+
+    def is_trading_day(self, day=None):
+        return True
+
+    def is_open(self, now=None):
+        return True
+
+    def next_open(self, now=None):
+        return self._now(now)
+
+    def next_close(self, now=None):
+        return None
+
+    def bar_bounds(self, timeframe, now=None):
+        now = self._now(now)
+        minutes = TIMEFRAME_MINUTES[timeframe]
+        midnight = datetime.combine(now.date(), dtime(0, 0), tzinfo=self.tz)
+        elapsed = int((now - midnight).total_seconds() // 60)
+        start = midnight + timedelta(minutes=(elapsed // minutes) * minutes)
+        return start, start + timedelta(minutes=minutes)
+
+
+def load_calendars(nse_file=None):
+    """
+    Returns {"NSE": ExchangeCalendar, "DELTA": AlwaysOpenCalendar}.
+    """
+    if nse_file is None:
+        nse_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nse_calendar.json")
+    return {
+        "NSE": ExchangeCalendar(nse_file),
+        "DELTA": AlwaysOpenCalendar()
+    }
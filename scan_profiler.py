@@ -0,0 +1,154 @@
+import cProfile
+import io
+import os
+import pstats
+import re
+import signal
+import threading
+import tracemalloc
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlparse, parse_qs
+from logzero import logger
+
+# Files written per cycle: <stamp>_<cycle>_<name> + .prof / _cpu.txt / _mem.txt
+REPORT_PATTERN = re.compile(r"^(\d{8}_\d{6}_\d{6}_\d+_.+?)(\.prof|_cpu\.txt|_mem\.txt)$")
+
+class ScanProfiler:
+    """
+    On-demand profiler for scan cycles.
+    Once armed (signal, env flag or HTTP trigger) the next N wrapped calls are run under
+    cProfile with a tracemalloc snapshot diff, and the reports are written to output_dir.
+    While disarmed the wrapper is a single integer check.
+    """
+    def __init__(self, output_dir="profiles", keep=30, top=25):
+        self.output_dir = output_dir
+        self.keep = keep
+        self.top = top
+        self._remaining = 0
+        self._cycle = 0
+        self._owns_tracing = False
+        self._lock = threading.Lock()
+
+    def arm(self, cycles=1):
+        self._remaining = max(0, int(cycles))
+        logger.info(f"Profiler armed for next {self._remaining} scan cycle(s).")
+
+    def wrap(self, func):
+        def wrapper(*args, **kwargs):
+            if not self._remaining:
+                return func(*args, **kwargs)
+            return self._profile_call(func, *args, **kwargs)
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+
+    def _profile_call(self, func, *args, **kwargs):
+        # Only one cycle is profiled at a time; overlapping scans run unprofiled
+        if not self._lock.acquire(blocking=False):
+            return func(*args, **kwargs)
+        try:
+            # Tracing is started once per armed run and stopped when it ends,
+            # unless something else in the process had already started it
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracing = True
+            snap_before = tracemalloc.take_snapshot()
+
+            prof = cProfile.Profile()
+            prof.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                prof.disable()
+                snap_after = tracemalloc.take_snapshot()
+                self._remaining = max(0, self._remaining - 1)
+                if self._owns_tracing and not self._remaining:
+                    tracemalloc.stop()
+                    self._owns_tracing = False
+                try:
+                    self._write_reports(func.__name__, prof, snap_before, snap_after)
+                except Exception as e:
+                    logger.error(f"Profiler Report Failed: {e}")
+        finally:
+            self._lock.release()
+
+    def _write_reports(self, name, prof, snap_before, snap_after):
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._cycle += 1
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        base = os.path.join(self.output_dir, f"{stamp}_{self._cycle}_{name}")
+
+        # Raw stats (load with pstats / snakeviz) + readable summary
+        prof.dump_stats(f"{base}.prof")
+        buf = io.StringIO()
+        pstats.Stats(prof, stream=buf).sort_stats("cumulative").print_stats(self.top)
+        with open(f"{base}_cpu.txt", 'w') as f:
+            f.write(buf.getvalue())
+
+        diff = snap_after.compare_to(snap_before, "lineno")
+        with open(f"{base}_mem.txt", 'w') as f:
+            f.write(f"Top {self.top} allocation changes during {name}\n")
+            for stat in diff[:self.top]:
+                f.write(f"{stat}\n")
+
+        logger.info(f"Profile written: {base}.prof ({self._remaining} cycle(s) left)")
+        self._rotate()
+
+    def _rotate(self):
+        # Keep the newest 'keep' cycles; only the profiler's own reports are touched
+        cycles = {}
+        for fname in os.listdir(self.output_dir):
+            match = REPORT_PATTERN.match(fname)
+            if match:
+                cycles.setdefault(match.group(1), []).append(fname)
+
+        for base in sorted(cycles)[:max(0, len(cycles) - self.keep)]:
+            for fname in cycles[base]:
+                try:
+                    os.remove(os.path.join(self.output_dir, fname))
+                except OSError as e:
+                    logger.warning(f"Could not remove old profile {fname}: {e}")
+
+    def install_signal_handler(self, cycles=1, signum=None):
+        """
+        kill -USR1 <pid> arms the profiler. Must be called from the main thread.
+        """
+        signum = signum or getattr(signal, "SIGUSR1", None)
+        if signum is None:
+            logger.warning("Profiler signal trigger not available on this platform.")
+            return
+        signal.signal(signum, lambda *_: self.arm(cycles))
+        logger.info(f"Profiler signal trigger installed (signal {int(signum)}).")
+
+    def start_http_trigger(self, port, host="127.0.0.1"):
+        """
+        GET /profile?cycles=N arms the profiler.
+        """
+        profiler = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != "/profile":
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                try:
+                    cycles = int(parse_qs(url.query).get("cycles", ["1"])[0])
+                except ValueError:
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+                profiler.arm(cycles)
+                self.send_response(200)
+                self.end_headers()
+                self.wfile.write(f"armed for {cycles} cycle(s)\n".encode())
+
+            def log_message(self, format, *args):
+                logger.debug(f"Profiler HTTP: {format % args}")
+
+        server = HTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        logger.info(f"Profiler HTTP trigger listening on {host}:{port}")
+        return server
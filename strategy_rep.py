@@ -3,13 +3,21 @@ import pandas as pd
 from logzero import logger
 
 class REPStrategy:
-    def __init__(self, rsi_period=14):
+    def __init__(self, rsi_period=14, indicator_cache=None):
         self.rsi_period = rsi_period
+        self.indicator_cache = indicator_cache
 
-    def calculate_rsi(self, df):
+    def calculate_rsi(self, df, symbol=None, timeframe=None):
+        """
+        Adds the 'rsi' column. When an IndicatorCache is attached and the frame is
+        identified by symbol/timeframe, the RSI is computed once per bar and shared.
+        """
         if df is None or len(df) < self.rsi_period:
             return None
-        df['rsi'] = ta.rsi(df['close'], length=self.rsi_period)
+        if self.indicator_cache is not None and symbol is not None and timeframe is not None:
+            df['rsi'] = self.indicator_cache.get(symbol, timeframe, "rsi", df, length=self.rsi_period)
+        else:
+            df['rsi'] = ta.rsi(df['close'], length=self.rsi_period)
         return df
 
     def check_parent_conditions(self, parent1_df, parent2_df, threshold_long=60, threshold_short=40, lookback=10):